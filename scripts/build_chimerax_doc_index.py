@@ -11,10 +11,42 @@ import json
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TypedDict
 
+# Files handed to each worker at once; keeps IPC overhead low for small pages.
+EXTRACT_CHUNKSIZE = 32
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_COMMAND_TITLE_PREFIX = "command:"
+_KEYWORD_RE = re.compile(r"\b[a-z][a-z0-9_]{3,}\b")
+_KEYWORD_STOP_WORDS = frozenset(
+    {
+        "been",
+        "command",
+        "commands",
+        "from",
+        "have",
+        "html",
+        "that",
+        "their",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "when",
+        "where",
+        "which",
+        "will",
+        "with",
+        "chimerax",
+    }
+)
+
 
 class HtmlInfo(TypedDict):
     """Extracted HTML metadata used by the index."""
@@ -92,13 +124,22 @@ class HTMLTextExtractor(html.parser.HTMLParser):
 
 
 def _normalize_spaces(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip()
+    return _WHITESPACE_RE.sub(" ", value).strip()
 
 
 def _relative_html_path(path: Path, root: Path) -> str:
     return path.relative_to(root).as_posix()
 
 
+def _html_files(directory: Path) -> list[Path]:
+    """Return ``*.html`` files in a directory, sorted by name."""
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name for entry in entries if entry.name.endswith(".html") and entry.is_file()
+        ]
+    return [directory.joinpath(name) for name in sorted(names)]
+
+
 def _short_description(text: str, limit: int = 300) -> str:
     if len(text) <= limit:
         return text
@@ -108,7 +149,7 @@ def _short_description(text: str, limit: int = 300) -> str:
 def extract_html_info(filepath: Path) -> HtmlInfo | None:
     """Extract title, headings, and text metadata from an HTML file."""
     try:
-        content = filepath.read_text(encoding="utf-8", errors="ignore")
+        content = filepath.read_bytes().decode("utf-8", errors="ignore")
     except OSError:
         return None
 
@@ -128,14 +169,22 @@ def extract_html_info(filepath: Path) -> HtmlInfo | None:
     }
 
 
+def extract_html_infos(html_files: list[Path]) -> list[HtmlInfo | None]:
+    """Extract metadata from HTML files in parallel, preserving input order."""
+    if len(html_files) <= 1:
+        return [extract_html_info(html_file) for html_file in html_files]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(extract_html_info, html_files, chunksize=EXTRACT_CHUNKSIZE))
+
+
 def parse_command_title(title: str) -> list[str]:
     """Extract command names from titles like ``Command: color, rainbow``."""
-    match = re.match(r"Command:\s*(.+)", title, re.IGNORECASE)
-    if not match:
+    prefix_len = len(_COMMAND_TITLE_PREFIX)
+    if title[:prefix_len].lower() != _COMMAND_TITLE_PREFIX:
         return []
 
     names = []
-    for name in match.group(1).split(","):
+    for name in title[prefix_len:].split(","):
         clean_name = name.strip()
         if clean_name and not clean_name.startswith("("):
             names.append(clean_name)
@@ -147,8 +196,8 @@ def build_commands_index(commands_dir: Path) -> dict[str, dict[str, str]]:
     commands: dict[str, dict[str, str]] = {}
     docs_root = commands_dir.parent.parent
 
-    for html_file in sorted(commands_dir.glob("*.html")):
-        info = extract_html_info(html_file)
+    html_files = _html_files(commands_dir)
+    for html_file, info in zip(html_files, extract_html_infos(html_files), strict=True):
         if info is None:
             continue
 
@@ -172,8 +221,8 @@ def build_tutorials_index(devel_dir: Path) -> dict[str, dict[str, str]]:
     if not tutorials_dir.exists():
         return tutorials
 
-    for html_file in sorted(tutorials_dir.glob("*.html")):
-        info = extract_html_info(html_file)
+    html_files = _html_files(tutorials_dir)
+    for html_file, info in zip(html_files, extract_html_infos(html_files), strict=True):
         if info is None:
             continue
 
@@ -194,24 +243,30 @@ def build_modules_index(devel_dir: Path) -> dict[str, dict[str, str]]:
     if not modules_dir.exists():
         return modules
 
-    for module_dir in sorted(modules_dir.iterdir()):
-        if not module_dir.is_dir():
-            continue
+    module_files: list[tuple[str, Path]] = []
+    with os.scandir(modules_dir) as entries:
+        module_names = sorted(entry.name for entry in entries if entry.is_dir())
+    for module_name in module_names:
+        module_dir = modules_dir.joinpath(module_name)
 
         html_file = module_dir.joinpath("index.html")
         if not html_file.exists():
             html_file = module_dir.joinpath(f"{module_dir.name}.html")
         if not html_file.exists():
-            candidates = sorted(module_dir.glob("*.html"))
+            candidates = _html_files(module_dir)
             if not candidates:
                 continue
             html_file = candidates[0]
+        module_files.append((module_name, html_file))
 
-        info = extract_html_info(html_file)
+    html_files = [html_file for _, html_file in module_files]
+    for (module_name, html_file), info in zip(
+        module_files, extract_html_infos(html_files), strict=True
+    ):
         if info is None:
             continue
 
-        modules[module_dir.name] = {
+        modules[module_name] = {
             "path": _relative_html_path(html_file, docs_root),
             "title": info["title"],
             "description": _short_description(info["description"], 200),
@@ -226,33 +281,12 @@ def build_keywords_index(
     modules: dict[str, dict[str, str]],
 ) -> dict[str, list[str]]:
     """Build a compact keyword-to-path lookup from indexed entries."""
-    keywords: dict[str, set[str]] = {}
-    stop_words = {
-        "been",
-        "command",
-        "commands",
-        "from",
-        "have",
-        "html",
-        "that",
-        "their",
-        "there",
-        "these",
-        "they",
-        "this",
-        "those",
-        "when",
-        "where",
-        "which",
-        "will",
-        "with",
-        "chimerax",
-    }
+    keywords: defaultdict[str, set[str]] = defaultdict(set)
 
     def add_keywords(text: str, path: str) -> None:
-        for word in set(re.findall(r"\b[a-z][a-z0-9_]{3,}\b", text.lower())):
-            if word not in stop_words:
-                keywords.setdefault(word, set()).add(path)
+        for word in _KEYWORD_RE.findall(text.lower()):
+            if word not in _KEYWORD_STOP_WORDS:
+                keywords[word].add(path)
 
     for entries in (commands, tutorials, modules):
         for name, info in entries.items():
@@ -353,7 +387,8 @@ def main() -> int:
 
     index = build_index(docs_path, version)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as output_file:
+        json.dump(index, output_file, indent=2, ensure_ascii=False)
 
     print(f"Index written to: {output_path}")
     print(f"  Commands: {len(index['commands'])}")
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from chimerax_mcp.server import mcp
+import signal
+
+from chimerax_mcp.server import _handle_sigterm, mcp
 
 
 def main() -> None:
     """Entry point for the MCP server."""
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     mcp.run()
 
 
@@ -7,6 +7,7 @@ import json
 import os
 import re
 from dataclasses import dataclass
+from functools import cache
 from html.parser import HTMLParser
 from importlib import resources
 from pathlib import Path
@@ -18,6 +19,12 @@ PACKAGED_INDEX_NAME = "chimerax-1.9.index.json"
 VALID_KINDS = ("all", "commands", "keywords", "modules", "tutorials")
 SEARCH_KINDS = ("commands", "tutorials", "modules")
 KIND_ERROR = "kind must be one of: all, commands, keywords, modules, tutorials"
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Parsed local indexes keyed by path, with the (mtime_ns, size) they were read at.
+_source_index_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 @dataclass(frozen=True)
@@ -225,13 +232,25 @@ def _repo_root() -> Path | None:
 
 def _load_source_index(source: DocIndexSource) -> dict[str, Any]:
     if source.kind == "packaged" or source.index_path is None:
-        return load_packaged_index()
-    return json.loads(source.index_path.read_text(encoding="utf-8"))
+        return _cached_packaged_index()
+    stat = source.index_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _source_index_cache.get(source.index_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index = json.loads(source.index_path.read_text(encoding="utf-8"))
+    _source_index_cache[source.index_path] = (signature, index)
+    return index
+
+
+@cache
+def _cached_packaged_index() -> dict[str, Any]:
+    return load_packaged_index()
 
 
 def _query_tokens(query: str) -> list[str]:
-    expanded = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", query)
-    return [token.lower() for token in re.findall(r"[A-Za-z0-9]+", expanded)]
+    expanded = _CAMEL_BOUNDARY_RE.sub(" ", query)
+    return [token.lower() for token in _TOKEN_RE.findall(expanded)]
 
 
 def _rank_index_records(
@@ -263,23 +282,21 @@ def _rank_index_records(
 
 
 def _record_score(name: str, record: dict[str, Any], tokens: list[str]) -> int:
-    haystacks = {
-        "name": name.lower(),
-        "path": str(record.get("path", "")).lower(),
-        "title": str(record.get("title", "")).lower(),
-        "description": str(record.get("description", "")).lower(),
-    }
+    lower_name = name.lower()
+    path = str(record.get("path", "")).lower()
+    title = str(record.get("title", "")).lower()
+    description = str(record.get("description", "")).lower()
     score = 0
     for token in tokens:
-        if token == haystacks["name"]:
+        if token == lower_name:
             score += 100
-        if token in haystacks["name"]:
+        if token in lower_name:
             score += 40
-        if token in haystacks["title"]:
+        if token in title:
             score += 20
-        if token in haystacks["path"]:
+        if token in path:
             score += 10
-        if token in haystacks["description"]:
+        if token in description:
             score += 5
     return score
 
@@ -413,7 +430,7 @@ def _html_to_text(source: str) -> str:
 
 
 def _normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _dedupe_parts(parts: Any) -> str:
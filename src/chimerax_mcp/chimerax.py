@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 import glob
+import itertools
 import logging
 import os
 import platform
 import re
 import subprocess
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from pathlib import Path
 from typing import Any
-from urllib.parse import quote
 
 import httpx
 
@@ -20,6 +21,15 @@ from chimerax_mcp.commands import quote_chimerax_path
 
 logger = logging.getLogger(__name__)
 
+# How long a successful is_running() probe is trusted before probing again.
+RUNNING_CHECK_TTL_SECONDS = 1.5
+
+# Per-process sequence number appended to default screenshot names, so names
+# generated within the same second by this server never collide.
+_screenshot_counter = itertools.count(1)
+
+_VERSION_RE = re.compile(r"ChimeraX[- ]?(\d[\d.]*)", re.IGNORECASE)
+
 
 @dataclass
 class ChimeraXInfo:
@@ -29,13 +39,29 @@ class ChimeraXInfo:
     version: str | None = None
 
 
+_installed_chimerax: ChimeraXInfo | None = None
+
+
 class ChimeraXClient:
     """Client for communicating with ChimeraX via REST API."""
 
     def __init__(self, host: str = "127.0.0.1", port: int = 63269) -> None:
         self.host = host
         self.port = port
-        self._client = httpx.Client(timeout=30.0)
+        # One local server handles one command at a time, so a small pool of
+        # long-lived connections is enough.
+        self._client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=4,
+                max_keepalive_connections=4,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # The version of a running instance never changes; cleared whenever
+        # the server is found to be down so a restarted ChimeraX is re-queried.
+        self._version: str | None = None
+        self._running_checked_at: float | None = None
 
     def __enter__(self) -> ChimeraXClient:
         return self
@@ -47,13 +73,38 @@ class ChimeraXClient:
     def base_url(self) -> str:
         return f"http://{self.host}:{self.port}"
 
-    def is_running(self) -> bool:
-        """Check if ChimeraX REST server is running."""
+    def is_running(self, fresh: bool = False) -> bool:
+        """Check if ChimeraX REST server is running.
+
+        A successful probe is reused for ``RUNNING_CHECK_TTL_SECONDS`` so a tool
+        call does not pay an extra round-trip right before its real command.
+
+        Args:
+            fresh: If True, always probe the REST server instead of reusing a
+                recent successful check.
+        """
+        checked_at = self._running_checked_at
+        if (
+            not fresh
+            and checked_at is not None
+            and time.monotonic() - checked_at < RUNNING_CHECK_TTL_SECONDS
+        ):
+            return True
         try:
             response = self._client.get(f"{self.base_url}/cmdline.html")
-            return response.status_code == 200
         except httpx.HTTPError:
+            self._forget_server()
             return False
+        if response.status_code != 200:
+            self._forget_server()
+            return False
+        self._running_checked_at = time.monotonic()
+        return True
+
+    def _forget_server(self) -> None:
+        """Drop everything cached about the running ChimeraX instance."""
+        self._version = None
+        self._running_checked_at = None
 
     def run_command(self, command: str) -> dict[str, Any]:
         """Execute a ChimeraX command and return the result.
@@ -61,8 +112,11 @@ class ChimeraXClient:
         Returns a normalized dict with keys: python_values, json_values,
         log_messages, error.  Works in both ``json true`` and plain-text modes.
         """
-        encoded = quote(command, safe="")
-        response = self._client.get(f"{self.base_url}/run?command={encoded}")
+        try:
+            response = self._client.get(f"{self.base_url}/run", params={"command": command})
+        except httpx.ConnectError:
+            self._forget_server()
+            raise
         response.raise_for_status()
 
         # Try JSON mode first, fall back to plain text
@@ -84,6 +138,14 @@ class ChimeraXClient:
                 "error": None,
             }
 
+    def run_commands(self, commands: list[str]) -> dict[str, Any]:
+        """Execute several ChimeraX commands in a single REST request.
+
+        The commands are chained with ``;`` so ChimeraX runs them in order and
+        returns one combined result, shaped like :meth:`run_command`.
+        """
+        return self.run_command("; ".join(commands))
+
     @staticmethod
     def _extract_output(result: dict[str, Any]) -> str:
         """Extract human-readable output from a command result."""
@@ -95,9 +157,13 @@ class ChimeraXClient:
         return "\n".join(lines)
 
     def get_version(self) -> str:
-        """Get ChimeraX version."""
-        result = self.run_command("version")
-        return self._extract_output(result).strip()
+        """Get ChimeraX version, cached for the lifetime of the running instance."""
+        if self._version is None:
+            version = self._extract_output(self.run_command("version")).strip()
+            if not version:
+                return version
+            self._version = version
+        return self._version
 
     def get_models(self) -> list[dict[str, Any]]:
         """Get list of open models."""
@@ -121,6 +187,7 @@ class ChimeraXClient:
         height: int = 768,
         format: str = "png",  # noqa: A002
         output_path: Path | None = None,
+        pre_commands: list[str] | None = None,
     ) -> Path:
         """Capture screenshot and save to file.
 
@@ -130,6 +197,9 @@ class ChimeraXClient:
             format: Image format (png, jpg).
             output_path: Where to save. If None, auto-generates under
                 ``~/.local/share/chimerax-mcp/screenshots/``.
+            pre_commands: Commands to run just before saving (e.g. ``["view"]``),
+                sent in the same request as the save. If they fail, the image
+                is still saved without them.
 
         Returns:
             Path to the saved image file.
@@ -139,14 +209,28 @@ class ChimeraXClient:
                 was not written after the save command.
         """
         if output_path is None:
-            screenshot_dir = Path.home().joinpath(".local", "share", "chimerax-mcp", "screenshots")
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")
-            output_path = screenshot_dir.joinpath(f"screenshot_{timestamp}.{format}")
+            screenshot_dir = ensure_screenshots_dir()
+            output_path = screenshot_dir.joinpath(next_screenshot_name("screenshot", format))
         else:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.run_command(f"save {quote_chimerax_path(output_path)} width {width} height {height}")
+        save_command = f"save {quote_chimerax_path(output_path)} width {width} height {height}"
+        if pre_commands:
+            # ChimeraX stops a chain at the first failing command and the
+            # plain-text REST reply does not report it, so fall back to a plain
+            # save whenever the chained request did not write the file. A timed
+            # out save may still be rendering, so it is not queued again.
+            previous = _file_signature(output_path)
+            try:
+                self.run_commands([*pre_commands, save_command])
+            except (httpx.ConnectError, httpx.TimeoutException):
+                raise
+            except httpx.HTTPError:
+                pass
+            if _file_signature(output_path) in (None, previous):
+                self.run_command(save_command)
+        else:
+            self.run_command(save_command)
 
         if not output_path.exists():
             msg = f"ChimeraX save command completed but file not found: {output_path}"
@@ -155,9 +239,37 @@ class ChimeraXClient:
 
     def close(self) -> None:
         """Close the HTTP client."""
+        self._forget_server()
         self._client.close()
 
 
+def default_screenshots_dir() -> Path:
+    """Return the default directory for screenshots saved by chimerax-mcp."""
+    return Path.home().joinpath(".local", "share", "chimerax-mcp", "screenshots")
+
+
+def ensure_screenshots_dir() -> Path:
+    """Return the default screenshots directory, creating it if it is missing."""
+    screenshot_dir = default_screenshots_dir()
+    screenshot_dir.mkdir(parents=True, exist_ok=True)
+    return screenshot_dir
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for an existing file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def next_screenshot_name(prefix: str, extension: str) -> str:
+    """Return a timestamped default screenshot file name that is unique within this process."""
+    stamp = f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}_{next(_screenshot_counter):06d}"
+    return f"{prefix}_{stamp}.{extension}"
+
+
 def _version_sort_key(path: str) -> tuple[int, ...]:
     """Extract version numbers from a ChimeraX path for natural sorting.
 
@@ -165,18 +277,31 @@ def _version_sort_key(path: str) -> tuple[int, ...]:
     "ChimeraX-1.10.app") and returns a tuple of integers for correct
     numeric comparison. Digits elsewhere in the path are ignored.
     """
-    match = re.search(r"ChimeraX[- ]?(\d[\d.]*)", path, re.IGNORECASE)
+    match = _VERSION_RE.search(path)
     if match:
         return tuple(int(n) for n in match.group(1).split(".") if n)
     return ()
 
 
+def _newest_match(patterns: list[str]) -> str | None:
+    """Return the highest-versioned path matching the first productive pattern."""
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        if matches:
+            return max(matches, key=_version_sort_key)
+    return None
+
+
 def detect_chimerax() -> ChimeraXInfo | None:
     """Auto-detect ChimeraX installation.
 
     The CHIMERAX_PATH environment variable takes priority over auto-detection,
     allowing users to specify a particular ChimeraX version or installation.
+    A successful auto-detection is remembered for the life of the process and
+    reused while the detected executable still exists.
     """
+    global _installed_chimerax
+
     env_path = os.environ.get("CHIMERAX_PATH")
     if env_path:
         path = Path(env_path)
@@ -187,6 +312,14 @@ def detect_chimerax() -> ChimeraXInfo | None:
             env_path,
         )
 
+    if _installed_chimerax is not None and _installed_chimerax.path.is_file():
+        return _installed_chimerax
+    _installed_chimerax = _find_installed_chimerax()
+    return _installed_chimerax
+
+
+def _find_installed_chimerax() -> ChimeraXInfo | None:
+    """Search the platform's standard install locations for ChimeraX."""
     system = platform.system()
 
     if system == "Darwin":
@@ -195,11 +328,9 @@ def detect_chimerax() -> ChimeraXInfo | None:
             "/Applications/UCSF-ChimeraX*.app/Contents/MacOS/ChimeraX",
             os.path.expanduser("~/Applications/ChimeraX*.app/Contents/MacOS/ChimeraX"),
         ]
-        for pattern in patterns:
-            matches = glob.glob(pattern)
-            if matches:
-                matches.sort(key=_version_sort_key, reverse=True)
-                return ChimeraXInfo(path=Path(matches[0]))
+        newest = _newest_match(patterns)
+        if newest is not None:
+            return ChimeraXInfo(path=Path(newest))
 
     elif system == "Linux":
         paths = [
@@ -217,11 +348,9 @@ def detect_chimerax() -> ChimeraXInfo | None:
             r"C:\Program Files\ChimeraX*\bin\ChimeraX-console.exe",
             r"C:\Program Files\UCSF\ChimeraX*\bin\ChimeraX-console.exe",
         ]
-        for pattern in patterns:
-            matches = glob.glob(pattern)
-            if matches:
-                matches.sort(key=_version_sort_key, reverse=True)
-                return ChimeraXInfo(path=Path(matches[0]))
+        newest = _newest_match(patterns)
+        if newest is not None:
+            return ChimeraXInfo(path=Path(newest))
 
     return None
 
@@ -164,8 +164,10 @@ except Exception as err:
 """
 
 
-def parse_introspection_result(result: dict[str, Any]) -> dict[str, Any]:
-    """Extract an introspection JSON payload from ChimeraX command output."""
+def parse_marker_payload(
+    result: dict[str, Any], marker: str, label: str = "introspection"
+) -> dict[str, Any]:
+    """Extract the JSON payload logged after ``marker`` from ChimeraX command output."""
     log_messages = result.get("log_messages", {})
     if isinstance(log_messages, dict):
         for level in ("info", "note", "warning", "error"):
@@ -173,26 +175,31 @@ def parse_introspection_result(result: dict[str, Any]) -> dict[str, Any]:
             if not isinstance(messages, list):
                 continue
             for message in messages:
-                if isinstance(message, str) and message.startswith(MARKER):
+                if isinstance(message, str) and message.startswith(marker):
                     try:
-                        payload = json.loads(message.removeprefix(MARKER))
+                        payload = json.loads(message.removeprefix(marker))
                     except json.JSONDecodeError as err:
                         return {
                             "status": "error",
-                            "message": f"Invalid introspection JSON payload: {err}",
+                            "message": f"Invalid {label} JSON payload: {err}",
                         }
                     if isinstance(payload, dict):
                         return payload
                     return {
                         "status": "error",
-                        "message": "Introspection JSON payload was not an object",
+                        "message": f"{label.capitalize()} JSON payload was not an object",
                     }
     return {
         "status": "error",
-        "message": "No introspection JSON payload found in ChimeraX output",
+        "message": f"No {label} JSON payload found in ChimeraX output",
     }
 
 
+def parse_introspection_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Extract an introspection JSON payload from ChimeraX command output."""
+    return parse_marker_payload(result, MARKER)
+
+
 def run_python_api_script(client: Any, script: str) -> dict[str, Any]:
     """Write, run, and parse a ChimeraX Python introspection script."""
     temp_path: Path | None = None
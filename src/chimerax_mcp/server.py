@@ -20,11 +20,19 @@ import httpx
 from fastmcp import FastMCP
 
 from chimerax_mcp.api_docs import read_api_target, search_api_index
-from chimerax_mcp.chimerax import ChimeraXClient, detect_chimerax, start_chimerax
+from chimerax_mcp.chimerax import (
+    ChimeraXClient,
+    default_screenshots_dir,
+    detect_chimerax,
+    ensure_screenshots_dir,
+    next_screenshot_name,
+    start_chimerax,
+)
 from chimerax_mcp.commands import quote_chimerax_path
 from chimerax_mcp.python_api import (
     build_python_dir_script,
     build_python_inspect_script,
+    parse_marker_payload,
     run_python_api_script,
     validate_symbol,
 )
@@ -46,8 +54,14 @@ VALID_IMAGE_FORMATS = {"png", "jpg", "jpeg"}
 MAX_IMAGE_DIMENSION = 8192
 MIN_IMAGE_DIMENSION = 1
 
+# Startup readiness polling
+_STARTUP_POLL_INITIAL_SECONDS = 0.01
+_STARTUP_POLL_MAX_SECONDS = 0.2
+_STARTUP_POLL_BACKOFF = 1.5
+
 # View management constants
 VALID_AXES = {"x", "y", "z"}
+_TURN_AXES = {spelling: axis for axis in VALID_AXES for spelling in (axis, axis.upper())}
 VALID_EXTERNAL_LINK_TARGETS = {"chimerax", "system"}
 VALID_LOG_LEVELS = {"error", "info", "warning"}
 _RESET_COMMANDS = [
@@ -60,21 +74,50 @@ _RESET_COMMANDS = [
     "view",
 ]
 
+# Validation messages listing the accepted values, built once at import
+_IMAGE_FORMAT_ERROR = f"Format must be one of: {', '.join(sorted(VALID_IMAGE_FORMATS))}"
+_AXIS_CHOICES = ", ".join(sorted(VALID_AXES))
+_LOG_LEVEL_ERROR = f"level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}"
+_THEME_ERROR = f"theme must be one of: {', '.join(sorted(VALID_RICH_REPORT_THEMES))}"
+_EXTERNAL_LINK_TARGET_ERROR = (
+    f"external_link_target must be one of: {', '.join(sorted(VALID_EXTERNAL_LINK_TARGETS))}"
+)
+
 
 def _cleanup() -> None:
-    """Cleanup ChimeraX process on exit."""
+    """Cleanup ChimeraX process and the shared HTTP client on exit."""
     global _process
+    _drop_client()
     if _process is not None:
         _process.terminate()
         try:
             _process.wait(timeout=5)
         except subprocess.TimeoutExpired:
             _process.kill()
+        _process = None
 
 
 atexit.register(_cleanup)
 
 
+def _handle_sigterm(signum: int, frame: object) -> None:
+    """Stop ChimeraX when the server is terminated; atexit alone misses SIGTERM."""
+    del frame
+    _cleanup()
+    # Exit immediately: a normal interpreter shutdown would block on the
+    # stdio transport's reader thread.
+    os._exit(128 + signum)
+
+
+def _drop_client() -> None:
+    """Close and forget the shared client, along with anything it cached."""
+    global _client
+    if _client is not None:
+        with contextlib.suppress(Exception):
+            _client.close()
+        _client = None
+
+
 def get_client(host: str = "127.0.0.1", port: int = 63269) -> ChimeraXClient:
     """Get or create the ChimeraX client."""
     global _client
@@ -126,7 +169,7 @@ def chimerax_start(
     client = get_client(port=port)
 
     # Check if already running via REST API
-    if client.is_running():
+    if client.is_running(fresh=True):
         response = {"status": "already_running", "message": "ChimeraX is already running"}
         if include_version:
             try:
@@ -145,23 +188,21 @@ def chimerax_start(
                 ),
             }
         # Process exists and is still running - wait for it
-        # Initial sleep to allow process to initialize
-        time.sleep(3.0)
-        remaining_checks = (wait_seconds - 3) * 2
-        for _ in range(max(remaining_checks, 1)):
-            time.sleep(0.5)
-            if client.is_running():
-                response = {
-                    "status": "started",
-                    "port": port,
-                    "note": "Connected to existing process",
-                }
-                if include_version:
-                    try:
-                        response["version"] = client.get_version()
-                    except httpx.HTTPError:
-                        response["version"] = "unknown"
-                return response
+        state = _wait_for_rest_api(client, _process, wait_seconds)
+        if state == "ready":
+            response = {
+                "status": "started",
+                "port": port,
+                "note": "Connected to existing process",
+            }
+            if include_version:
+                try:
+                    response["version"] = client.get_version()
+                except httpx.HTTPError:
+                    response["version"] = "unknown"
+            return response
+        if state == "exited":
+            return _exited_during_startup()
         return {
             "status": "timeout",
             "message": (
@@ -183,23 +224,20 @@ def chimerax_start(
             ),
         }
 
-    # Initial sleep to allow ChimeraX to launch (especially important on macOS)
-    time.sleep(3.0)
-
-    remaining_checks = (wait_seconds - 3) * 2
-    for _ in range(max(remaining_checks, 1)):
-        time.sleep(0.5)
-        if client.is_running():
-            response = {
-                "status": "started",
-                "port": port,
-            }
-            if include_version:
-                try:
-                    response["version"] = client.get_version()
-                except httpx.HTTPError:
-                    response["version"] = "unknown"
-            return response
+    state = _wait_for_rest_api(client, _process, wait_seconds)
+    if state == "ready":
+        response = {
+            "status": "started",
+            "port": port,
+        }
+        if include_version:
+            try:
+                response["version"] = client.get_version()
+            except httpx.HTTPError:
+                response["version"] = "unknown"
+        return response
+    if state == "exited":
+        return _exited_during_startup()
 
     return {
         "status": "timeout",
@@ -210,6 +248,43 @@ def chimerax_start(
     }
 
 
+def _wait_for_rest_api(
+    client: ChimeraXClient,
+    process: subprocess.Popen[bytes],
+    wait_seconds: int,
+) -> str:
+    """Wait for the ChimeraX REST API to answer.
+
+    Probes from the first tick with exponential backoff, starting at
+    ``_STARTUP_POLL_INITIAL_SECONDS`` and capped at ``_STARTUP_POLL_MAX_SECONDS``.
+    Returns ``"ready"`` once the REST API responds, ``"exited"`` as soon as the
+    ChimeraX process dies, or ``"timeout"`` once ``wait_seconds`` of wall-clock
+    time have passed, including the time spent in probes.
+    """
+    deadline = time.monotonic() + wait_seconds
+    delay = _STARTUP_POLL_INITIAL_SECONDS
+    while True:
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+        if process.poll() is not None:
+            return "exited"
+        if client.is_running():
+            return "ready"
+        if time.monotonic() >= deadline:
+            return "timeout"
+        delay = min(delay * _STARTUP_POLL_BACKOFF, _STARTUP_POLL_MAX_SECONDS)
+
+
+def _exited_during_startup() -> dict[str, Any]:
+    """Forget a ChimeraX process that died before its REST API came up."""
+    global _process
+    returncode = _process.returncode if _process is not None else None
+    _process = None
+    return {
+        "status": "error",
+        "message": f"ChimeraX exited during startup (exit code {returncode})",
+    }
+
+
 @mcp.tool()
 def chimerax_stop() -> dict[str, Any]:
     """Stop the ChimeraX process started by this server.
@@ -224,6 +299,8 @@ def chimerax_stop() -> dict[str, Any]:
 
     proc = _process  # Capture for type narrowing
     proc.terminate()
+    # A later start may bring up a different ChimeraX; don't reuse its version.
+    _drop_client()
     try:
         proc.wait(timeout=5)
         _process = None
@@ -247,7 +324,7 @@ def chimerax_status(include_version: bool = False) -> dict[str, Any]:
         Connection status and version if running.
     """
     client = get_client()
-    if client.is_running():
+    if client.is_running(fresh=True):
         response: dict[str, Any] = {"status": "ok", "running": True}
         if include_version:
             try:
@@ -652,7 +729,7 @@ def chimerax_rich_log(
     if normalized_level is None:
         return {
             "status": "error",
-            "message": f"level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}",
+            "message": _LOG_LEVEL_ERROR,
         }
 
     rich_html = _build_rich_log_html(html=html, title=title)
@@ -705,24 +782,21 @@ def chimerax_rich_report(
     if normalized_level is None:
         return {
             "status": "error",
-            "message": f"level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}",
+            "message": _LOG_LEVEL_ERROR,
         }
 
     normalized_theme = theme.strip().lower()
     if normalized_theme not in VALID_RICH_REPORT_THEMES:
         return {
             "status": "error",
-            "message": f"theme must be one of: {', '.join(sorted(VALID_RICH_REPORT_THEMES))}",
+            "message": _THEME_ERROR,
         }
 
     normalized_external_link_target = _validate_external_link_target(external_link_target)
     if normalized_external_link_target is None:
         return {
             "status": "error",
-            "message": (
-                "external_link_target must be one of: "
-                f"{', '.join(sorted(VALID_EXTERNAL_LINK_TARGETS))}"
-            ),
+            "message": _EXTERNAL_LINK_TARGET_ERROR,
         }
 
     validation_error = _validate_rich_report_blocks(blocks)
@@ -789,24 +863,21 @@ def chimerax_structure_report(
     if normalized_level is None:
         return {
             "status": "error",
-            "message": f"level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}",
+            "message": _LOG_LEVEL_ERROR,
         }
 
     normalized_theme = theme.strip().lower()
     if normalized_theme not in VALID_RICH_REPORT_THEMES:
         return {
             "status": "error",
-            "message": f"theme must be one of: {', '.join(sorted(VALID_RICH_REPORT_THEMES))}",
+            "message": _THEME_ERROR,
         }
 
     normalized_external_link_target = _validate_external_link_target(external_link_target)
     if normalized_external_link_target is None:
         return {
             "status": "error",
-            "message": (
-                "external_link_target must be one of: "
-                f"{', '.join(sorted(VALID_EXTERNAL_LINK_TARGETS))}"
-            ),
+            "message": _EXTERNAL_LINK_TARGET_ERROR,
         }
 
     for value, name in (
@@ -896,17 +967,17 @@ def chimerax_turn(axis: str = "y", angle: float = 90, frames: int = 1) -> dict[s
     Returns:
         Result of the turn command.
     """
-    if axis.lower() not in VALID_AXES:
+    turn_axis = _TURN_AXES.get(axis)
+    if turn_axis is None:
         return {
             "status": "error",
-            "message": f"Invalid axis '{axis}'. Must be one of: {', '.join(sorted(VALID_AXES))}",
+            "message": f"Invalid axis '{axis}'. Must be one of: {_AXIS_CHOICES}",
         }
     if frames < 1:
         return {"status": "error", "message": "frames must be >= 1"}
-    command = f"turn {axis.lower()} {angle}"
-    if frames > 1:
-        command = f"{command} {frames}"
-    return _run_command(command)
+    if frames == 1:
+        return _run_command(f"turn {turn_axis} {angle}")
+    return _run_command(f"turn {turn_axis} {angle} {frames}")
 
 
 @mcp.tool()
@@ -923,6 +994,36 @@ def chimerax_reset() -> dict[str, Any]:
     if not client.is_running():
         return {"status": "error", "message": "ChimeraX is not running"}
 
+    # Send the whole reset as one chained request; ChimeraX stops a chain at
+    # the first failing command, so only then re-run them one by one to
+    # report exactly which commands failed.
+    try:
+        result = client.run_commands(_RESET_COMMANDS)
+        if result.get("error") is None:
+            return {
+                "status": "ok",
+                "message": f"Reset complete ({len(_RESET_COMMANDS)} commands executed)",
+            }
+    except httpx.ConnectError as e:
+        return {
+            "status": "error",
+            "message": "Lost connection to ChimeraX during reset",
+            "errors": [f"{'; '.join(_RESET_COMMANDS)}: {e}"],
+        }
+    except httpx.TimeoutException as e:
+        return {
+            "status": "error",
+            "message": "Timed out waiting for ChimeraX during reset",
+            "errors": [f"{'; '.join(_RESET_COMMANDS)}: {e}"],
+        }
+    except httpx.HTTPError:
+        pass
+
+    return _run_reset_commands_individually(client)
+
+
+def _run_reset_commands_individually(client: ChimeraXClient) -> dict[str, Any]:
+    """Run each reset command separately, collecting per-command errors."""
     errors: list[str] = []
     for cmd in _RESET_COMMANDS:
         try:
@@ -948,6 +1049,61 @@ def chimerax_reset() -> dict[str, Any]:
     return {"status": "ok", "message": f"Reset complete ({len(_RESET_COMMANDS)} commands executed)"}
 
 
+# Prefix of the single result line logged by the tool screenshot script
+_TOOL_SCREENSHOT_MARKER = "CHIMERAX_MCP_TOOL_SCREENSHOT_JSON="
+
+# Fixed part of the tool screenshot script; only the variable header changes per call.
+_TOOL_SCREENSHOT_SCRIPT_BODY = """
+
+def emit(payload):
+    session.logger.info(marker + json.dumps(payload))
+
+
+target = None
+for t in session.tools.list():
+    if t.tool_name == tool_name:
+        target = t
+        break
+
+if target is None:
+    emit({'status': 'error', 'message': 'Tool ' + repr(tool_name) + ' not found'})
+else:
+    try:
+        ua = target.tool_window.ui_area
+        original_size = ua.size()
+
+        if resize_w is not None and resize_h is not None:
+            ua.resize(resize_w, resize_h)
+            QApplication.processEvents()
+        elif resize_w is not None:
+            ua.resize(resize_w, original_size.height())
+            QApplication.processEvents()
+        elif resize_h is not None:
+            ua.resize(original_size.width(), resize_h)
+            QApplication.processEvents()
+
+        pixmap = ua.grab()
+
+        if resize_w is not None or resize_h is not None:
+            ua.resize(original_size)
+            QApplication.processEvents()
+
+        if padding > 0:
+            padded = QPixmap(pixmap.width() + 2 * padding, pixmap.height() + 2 * padding)
+            padded.fill(QColor(255, 255, 255))
+            painter = QPainter(padded)
+            painter.drawPixmap(padding, padding, pixmap)
+            painter.end()
+            pixmap = padded
+
+        if not pixmap.save(output_path):
+            emit({'status': 'error', 'message': f'Failed to save screenshot to {output_path!r}'})
+        else:
+            emit({'status': 'ok', 'file_path': output_path})
+    except Exception as exc:
+        emit({'status': 'error', 'message': str(exc)})"""
+
+
 def _build_tool_screenshot_script(
     tool_name: str,
     output_path: str,
@@ -961,9 +1117,9 @@ def _build_tool_screenshot_script(
     finds a tool by name, optionally resizes its Qt widget, captures it via
     ``QWidget.grab()``, optionally adds white padding, and saves the result.
 
-    The script communicates results back via session.logger.info() which
-    appears in JSON response log_messages: ``OK: <path>`` on success,
-    ``ERROR: <message>`` on failure.
+    The script reports back with a single session.logger.info() line made of
+    ``_TOOL_SCREENSHOT_MARKER`` followed by a JSON payload whose ``status`` is
+    ``ok`` or ``error``; see :func:`chimerax_mcp.python_api.parse_marker_payload`.
 
     Args:
         tool_name: Name of the ChimeraX tool to capture.
@@ -975,61 +1131,20 @@ def _build_tool_screenshot_script(
     Returns:
         A string containing the Python script to execute inside ChimeraX.
     """
-    lines = [
-        "from Qt.QtGui import QPixmap, QPainter, QColor",
-        "from Qt.QtWidgets import QApplication",
-        "",
-        f"tool_name = {tool_name!r}",
-        f"output_path = {output_path!r}",
-        f"resize_w = {width!r}",
-        f"resize_h = {height!r}",
-        f"padding = {padding!r}",
-        "",
-        "target = None",
-        "for t in session.tools.list():",
-        "    if t.tool_name == tool_name:",
-        "        target = t",
-        "        break",
-        "",
-        "if target is None:",
-        "    session.logger.info('ERROR: Tool ' + repr(tool_name) + ' not found')",
-        "else:",
-        "    try:",
-        "        ua = target.tool_window.ui_area",
-        "        original_size = ua.size()",
-        "",
-        "        if resize_w is not None and resize_h is not None:",
-        "            ua.resize(resize_w, resize_h)",
-        "            QApplication.processEvents()",
-        "        elif resize_w is not None:",
-        "            ua.resize(resize_w, original_size.height())",
-        "            QApplication.processEvents()",
-        "        elif resize_h is not None:",
-        "            ua.resize(original_size.width(), resize_h)",
-        "            QApplication.processEvents()",
-        "",
-        "        pixmap = ua.grab()",
-        "",
-        "        if resize_w is not None or resize_h is not None:",
-        "            ua.resize(original_size)",
-        "            QApplication.processEvents()",
-        "",
-        "        if padding > 0:",
-        "            padded = QPixmap(pixmap.width() + 2 * padding, pixmap.height() + 2 * padding)",
-        "            padded.fill(QColor(255, 255, 255))",
-        "            painter = QPainter(padded)",
-        "            painter.drawPixmap(padding, padding, pixmap)",
-        "            painter.end()",
-        "            pixmap = padded",
-        "",
-        "        if not pixmap.save(output_path):",
-        "            session.logger.info(f'ERROR: Failed to save screenshot to {output_path!r}')",
-        "        else:",
-        "            session.logger.info(f'OK: {output_path}')",
-        "    except Exception as exc:",
-        "        session.logger.info('ERROR: ' + str(exc))",
-    ]
-    return "\n".join(lines)
+    header = (
+        "import json\n"
+        "\n"
+        "from Qt.QtGui import QPixmap, QPainter, QColor\n"
+        "from Qt.QtWidgets import QApplication\n"
+        "\n"
+        f"marker = {_TOOL_SCREENSHOT_MARKER!r}\n"
+        f"tool_name = {tool_name!r}\n"
+        f"output_path = {output_path!r}\n"
+        f"resize_w = {width!r}\n"
+        f"resize_h = {height!r}\n"
+        f"padding = {padding!r}\n"
+    )
+    return header + _TOOL_SCREENSHOT_SCRIPT_BODY
 
 
 @mcp.tool()
@@ -1085,10 +1200,7 @@ def chimerax_tool_screenshot(
     if output_path is not None:
         resolved = Path(output_path.strip())
     else:
-        screenshots_dir = Path.home().joinpath(".local", "share", "chimerax-mcp", "screenshots")
-        screenshots_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        resolved = screenshots_dir.joinpath(f"tool_{timestamp}.png")
+        resolved = ensure_screenshots_dir().joinpath(next_screenshot_name("tool", "png"))
 
     # Build and write temp script
     script = _build_tool_screenshot_script(
@@ -1105,20 +1217,22 @@ def chimerax_tool_screenshot(
         script_path.write_text(script)
 
         result = client.run_command(f"runscript {quote_chimerax_path(script_path)}")
-        output = client._extract_output(result)
-
-        if "ERROR:" in output:
-            msg = output.split("ERROR:", 1)[1].strip()
-            return {"status": "error", "message": msg}
-
-        if "OK:" in output:
-            return {
-                "status": "ok",
-                "tool_name": tool_name.strip(),
-                "file_path": str(resolved),
-            }
-
-        return {"status": "error", "message": f"Unexpected output: {output}"}
+        payload = parse_marker_payload(result, _TOOL_SCREENSHOT_MARKER, "tool screenshot")
+        if payload.get("status") != "ok":
+            message = str(payload.get("message", "unknown error"))
+            err = result.get("error")
+            output = client._extract_output(result)
+            if err is not None:
+                detail = err.get("message", "unknown error") if isinstance(err, dict) else str(err)
+                message = f"{message}: {detail}"
+            elif _TOOL_SCREENSHOT_MARKER not in output:
+                message = f"{message}. Output: {output}"
+            return {"status": "error", "message": message}
+        return {
+            "status": "ok",
+            "tool_name": tool_name.strip(),
+            "file_path": str(resolved),
+        }
     except httpx.HTTPError as e:
         return {"status": "error", "message": f"HTTP error: {e}"}
     finally:
@@ -1162,7 +1276,7 @@ def chimerax_screenshot(
     if format.lower() not in VALID_IMAGE_FORMATS:
         return {
             "status": "error",
-            "message": f"Format must be one of: {', '.join(VALID_IMAGE_FORMATS)}",
+            "message": _IMAGE_FORMAT_ERROR,
         }
     if output_path is not None:
         stripped = output_path.strip()
@@ -1176,13 +1290,13 @@ def chimerax_screenshot(
     if not client.is_running():
         return {"status": "error", "message": "ChimeraX is not running"}
 
-    if auto_fit:
-        with contextlib.suppress(httpx.HTTPError):
-            client.run_command("view")
-
     try:
         file_path = client.screenshot(
-            width=width, height=height, format=format.lower(), output_path=resolved_path
+            width=width,
+            height=height,
+            format=format.lower(),
+            output_path=resolved_path,
+            pre_commands=["view"] if auto_fit else None,
         )
         return {
             "status": "ok",
@@ -1249,11 +1363,6 @@ def chimerax_session_open(path: str) -> dict[str, Any]:
     return _run_command(f"open {quote_chimerax_path(path)}")
 
 
-def _get_screenshots_dir() -> Path:
-    """Get the screenshots directory path."""
-    return Path.home().joinpath(".local", "share", "chimerax-mcp", "screenshots")
-
-
 @mcp.tool()
 def chimerax_list_screenshots() -> dict[str, Any]:
     """List all screenshots saved by chimerax-mcp.
@@ -1261,7 +1370,7 @@ def chimerax_list_screenshots() -> dict[str, Any]:
     Returns:
         List of screenshot files with their details (path, size, modification time).
     """
-    screenshots_dir = _get_screenshots_dir()
+    screenshots_dir = default_screenshots_dir()
     if not screenshots_dir.exists():
         return {"status": "ok", "screenshots": [], "message": "No screenshots directory found"}
 
@@ -1302,7 +1411,7 @@ def chimerax_cleanup_screenshots(older_than_days: int = 7) -> dict[str, Any]:
     Returns:
         Number of deleted files and freed space.
     """
-    screenshots_dir = _get_screenshots_dir()
+    screenshots_dir = default_screenshots_dir()
     if not screenshots_dir.exists():
         return {"status": "ok", "deleted": 0, "message": "No screenshots directory found"}
 
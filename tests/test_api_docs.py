@@ -94,6 +94,21 @@ def test_read_api_target_returns_packaged_metadata_summary():
     assert result["truncated"] is False
 
 
+def test_local_index_is_cached_until_file_changes(tmp_path):
+    index_path = tmp_path.joinpath("chimerax-test.index.json")
+    index_path.write_text(json.dumps({"version": "one"}), encoding="utf-8")
+    source = DocIndexSource(kind="local", index_path=index_path)
+
+    first = search_api_index("atomic", source=source)
+    assert api_docs._load_source_index(source) is api_docs._load_source_index(source)
+
+    index_path.write_text(json.dumps({"version": "second"}), encoding="utf-8")
+    second = search_api_index("atomic", source=source)
+
+    assert first["version"] == "one"
+    assert second["version"] == "second"
+
+
 def test_read_api_target_extracts_local_html(tmp_path):
     docs_root = tmp_path.joinpath("docs")
     html_path = docs_root.joinpath("devel", "modules", "atomic", "atomic.html")
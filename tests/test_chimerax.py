@@ -3,6 +3,7 @@
 import os
 import platform
 import re
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,8 +13,11 @@ import pytest
 from chimerax_mcp.chimerax import (
     ChimeraXClient,
     ChimeraXInfo,
+    _newest_match,
     _version_sort_key,
     detect_chimerax,
+    ensure_screenshots_dir,
+    next_screenshot_name,
 )
 
 
@@ -64,6 +68,39 @@ class TestChimeraXClient:
         assert urls == ["http://127.0.0.1:59998/cmdline.html"]
         assert all("command=version" not in url for url in urls)
 
+    def test_is_running_reuses_recent_success(self):
+        """A successful probe is trusted for a short TTL."""
+        client = ChimeraXClient(port=59998)
+        response = httpx.Response(200, request=httpx.Request("GET", "http://x/cmdline.html"))
+
+        with patch.object(client._client, "get", return_value=response) as mock_get:
+            assert client.is_running() is True
+            assert client.is_running() is True
+
+        assert mock_get.call_count == 1
+
+    def test_is_running_fresh_bypasses_recent_success(self):
+        """A fresh check always probes, so a stopped server is noticed at once."""
+        client = ChimeraXClient(port=59998)
+        response = httpx.Response(200, request=httpx.Request("GET", "http://x/cmdline.html"))
+
+        with patch.object(client._client, "get", return_value=response):
+            assert client.is_running() is True
+        with patch.object(client._client, "get", side_effect=httpx.ConnectError("down")):
+            assert client.is_running(fresh=True) is False
+
+    def test_is_running_probes_again_after_connect_error(self):
+        """A ConnectError from run_command drops the cached probe."""
+        client = ChimeraXClient(port=59998)
+        response = httpx.Response(200, request=httpx.Request("GET", "http://x/cmdline.html"))
+
+        with patch.object(client._client, "get", return_value=response):
+            assert client.is_running() is True
+        with patch.object(client._client, "get", side_effect=httpx.ConnectError("down")):
+            with pytest.raises(httpx.ConnectError):
+                client.run_command("version")
+            assert client.is_running() is False
+
     def test_context_manager(self):
         with ChimeraXClient(port=59999) as client:
             assert client.host == "127.0.0.1"
@@ -116,6 +153,18 @@ class TestRunCommand:
         assert result["log_messages"]["info"] == ["UCSF ChimeraX version 1.9"]
         assert result["error"] is None
 
+    def test_command_sent_as_query_param(self):
+        """The command is passed as the 'command' query parameter of /run."""
+        client = ChimeraXClient(port=59998)
+        fake_response = self._fake_response(text="")
+
+        with patch.object(client._client, "get", return_value=fake_response) as mock_get:
+            client.run_command("open 1abc; color red")
+
+        mock_get.assert_called_once_with(
+            "http://127.0.0.1:59998/run", params={"command": "open 1abc; color red"}
+        )
+
     def test_plain_text_empty(self):
         """Empty text response produces empty info list."""
         client = ChimeraXClient(port=59998)
@@ -155,6 +204,20 @@ class TestRunCommand:
         assert ChimeraXClient._extract_output({}) == ""
         assert ChimeraXClient._extract_output({"log_messages": {}}) == ""
 
+    def test_run_commands_joins_into_one_request(self):
+        """run_commands chains commands with ';' into a single run_command call."""
+        client = ChimeraXClient(port=59998)
+        calls: list[str] = []
+
+        def fake_run(cmd: str):
+            calls.append(cmd)
+            return {"python_values": [], "json_values": [], "log_messages": {}, "error": None}
+
+        client.run_command = fake_run  # type: ignore[assignment]
+        result = client.run_commands(["hide atoms", "cartoon", "view"])
+        assert calls == ["hide atoms; cartoon; view"]
+        assert result["error"] is None
+
     def test_get_version_from_json(self):
         """get_version extracts version from info messages."""
         client = ChimeraXClient(port=59998)
@@ -170,6 +233,36 @@ class TestRunCommand:
         client.run_command = fake_run  # type: ignore[assignment]
         assert client.get_version() == "UCSF ChimeraX version 1.9"
 
+    def test_get_version_is_cached(self):
+        """get_version queries ChimeraX once and reuses the result."""
+        client = ChimeraXClient(port=59998)
+        calls: list[str] = []
+
+        def fake_run(cmd: str):
+            calls.append(cmd)
+            return {"log_messages": {"info": ["UCSF ChimeraX version 1.9"]}}
+
+        client.run_command = fake_run  # type: ignore[assignment]
+        assert client.get_version() == "UCSF ChimeraX version 1.9"
+        assert client.get_version() == "UCSF ChimeraX version 1.9"
+        assert calls == ["version"]
+
+    def test_get_version_cache_cleared_when_not_running(self):
+        """A failed is_running check drops the cached version."""
+        client = ChimeraXClient(port=59998)
+        calls: list[str] = []
+
+        def fake_run(cmd: str):
+            calls.append(cmd)
+            return {"log_messages": {"info": ["UCSF ChimeraX version 1.9"]}}
+
+        client.run_command = fake_run  # type: ignore[assignment]
+        client.get_version()
+        with patch.object(client._client, "get", side_effect=httpx.ConnectError("down")):
+            assert client.is_running() is False
+        client.get_version()
+        assert calls == ["version", "version"]
+
     def test_get_models_from_json_values(self):
         """get_models prefers json_values when available."""
         client = ChimeraXClient(port=59998)
@@ -235,7 +328,7 @@ class TestScreenshot:
             result = client.screenshot(width=200, height=150, format="png")
 
         assert result.parent == tmp_path.joinpath(".local", "share", "chimerax-mcp", "screenshots")
-        assert re.match(r"screenshot_\d{8}_\d{6}_\d{6}\.png", result.name)
+        assert re.fullmatch(r"screenshot_\d{8}_\d{6}_\d+_\d{6}\.png", result.name)
         assert len(commands_called) == 1
         assert "save" in commands_called[0]
         assert "width 200" in commands_called[0]
@@ -257,6 +350,107 @@ class TestScreenshot:
         assert result == user_path
         assert result.exists()
 
+    def test_pre_commands_chained_with_save(self, tmp_path: Path):
+        """pre_commands run in the same request as the save."""
+        client = ChimeraXClient(port=59998)
+        user_path = tmp_path.joinpath("shot.png")
+        commands_called: list[str] = []
+
+        def fake_run_command(cmd: str):
+            commands_called.append(cmd)
+            user_path.write_bytes(b"PNG_DATA")
+            return self._ok_result()
+
+        client.run_command = fake_run_command  # type: ignore[assignment]
+
+        client.screenshot(width=100, height=80, output_path=user_path, pre_commands=["view"])
+        assert commands_called == [f"view; save {user_path} width 100 height 80"]
+
+    def test_failing_pre_commands_fall_back_to_plain_save(self, tmp_path: Path):
+        """If the chained request fails, the image is saved without pre_commands."""
+        client = ChimeraXClient(port=59998)
+        user_path = tmp_path.joinpath("shot.png")
+        commands_called: list[str] = []
+
+        def fake_run_command(cmd: str):
+            commands_called.append(cmd)
+            if cmd.startswith("view"):
+                raise httpx.HTTPError("view failed")
+            user_path.write_bytes(b"PNG_DATA")
+            return self._ok_result()
+
+        client.run_command = fake_run_command  # type: ignore[assignment]
+
+        result = client.screenshot(
+            width=100, height=80, output_path=user_path, pre_commands=["view"]
+        )
+        assert result == user_path
+        assert commands_called[-1] == f"save {user_path} width 100 height 80"
+        assert len(commands_called) == 2
+
+    def test_timed_out_chain_is_not_saved_again(self, tmp_path: Path):
+        """A timeout on the chained save is raised rather than queueing a second save."""
+        client = ChimeraXClient(port=59998)
+        user_path = tmp_path.joinpath("shot.png")
+        commands_called: list[str] = []
+
+        def fake_run_command(cmd: str):
+            commands_called.append(cmd)
+            raise httpx.ReadTimeout("timed out")
+
+        client.run_command = fake_run_command  # type: ignore[assignment]
+
+        with pytest.raises(httpx.TimeoutException):
+            client.screenshot(width=100, height=80, output_path=user_path, pre_commands=["view"])
+        assert len(commands_called) == 1
+
+    def test_plain_text_chain_without_file_falls_back_to_plain_save(self, tmp_path: Path):
+        """In plain-text mode a failed chain reports no error, so the file decides."""
+        client = ChimeraXClient(port=59998)
+        user_path = tmp_path.joinpath("shot.png")
+        commands_called: list[str] = []
+
+        def fake_run_command(cmd: str):
+            commands_called.append(cmd)
+            if cmd.startswith("save"):
+                user_path.write_bytes(b"PNG_DATA")
+            return {
+                "python_values": [],
+                "json_values": [],
+                "log_messages": {"info": ["Unknown command: view bogus"]},
+                "error": None,
+            }
+
+        client.run_command = fake_run_command  # type: ignore[assignment]
+
+        result = client.screenshot(
+            width=100, height=80, output_path=user_path, pre_commands=["view bogus"]
+        )
+        assert result == user_path
+        assert commands_called == [
+            f"view bogus; save {user_path} width 100 height 80",
+            f"save {user_path} width 100 height 80",
+        ]
+
+    def test_stale_file_does_not_count_as_chained_save(self, tmp_path: Path):
+        """An existing file at output_path is not mistaken for a successful chain."""
+        client = ChimeraXClient(port=59998)
+        user_path = tmp_path.joinpath("shot.png")
+        user_path.write_bytes(b"OLD")
+        commands_called: list[str] = []
+
+        def fake_run_command(cmd: str):
+            commands_called.append(cmd)
+            if cmd.startswith("save"):
+                user_path.write_bytes(b"NEW_PNG_DATA")
+            return self._ok_result()
+
+        client.run_command = fake_run_command  # type: ignore[assignment]
+
+        client.screenshot(width=100, height=80, output_path=user_path, pre_commands=["view"])
+        assert len(commands_called) == 2
+        assert user_path.read_bytes() == b"NEW_PNG_DATA"
+
     def test_explicit_output_path_with_spaces_is_quoted(self, tmp_path: Path):
         """Paths with spaces are quoted before sending the save command to ChimeraX."""
         client = ChimeraXClient(port=59998)
@@ -289,6 +483,41 @@ class TestScreenshot:
             client.screenshot(output_path=tmp_path.joinpath("missing.png"))
 
 
+class TestNextScreenshotName:
+    def test_names_are_unique_and_ordered(self):
+        """Names captured in the same second still differ by their counter."""
+        first = next_screenshot_name("tool", "png")
+        second = next_screenshot_name("tool", "png")
+        assert first != second
+        assert re.fullmatch(r"tool_\d{8}_\d{6}_\d+_\d{6}\.png", second)
+        assert int(first.rsplit("_", 1)[1].split(".")[0]) < int(
+            second.rsplit("_", 1)[1].split(".")[0]
+        )
+
+    def test_names_use_the_capture_time(self):
+        """Each name carries the time it was generated, not the server start time."""
+        with patch("chimerax_mcp.chimerax.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 1, 12, 0, 0)
+            early = next_screenshot_name("screenshot", "png")
+            mock_datetime.now.return_value = datetime(2026, 1, 2, 8, 30, 15)
+            late = next_screenshot_name("screenshot", "png")
+
+        assert early.startswith(f"screenshot_20260101_120000_{os.getpid()}_")
+        assert late.startswith(f"screenshot_20260102_083015_{os.getpid()}_")
+
+
+class TestEnsureScreenshotsDir:
+    def test_recreates_deleted_directory(self, tmp_path: Path):
+        """The default directory is re-created if it is removed between captures."""
+        expected = tmp_path.joinpath(".local", "share", "chimerax-mcp", "screenshots")
+
+        with patch("chimerax_mcp.chimerax.Path.home", return_value=tmp_path):
+            assert ensure_screenshots_dir() == expected
+            expected.rmdir()
+            assert ensure_screenshots_dir() == expected
+        assert expected.is_dir()
+
+
 class TestDetectChimeraX:
     def test_detect_returns_info_or_none(self):
         result = detect_chimerax()
@@ -313,6 +542,37 @@ class TestDetectChimeraX:
         assert result is not None
         assert result.path == fake_binary
 
+    def test_auto_detection_is_reused(self, tmp_path, monkeypatch):
+        """A successful auto-detection is not repeated while the binary exists."""
+        fake_binary = tmp_path.joinpath("ChimeraX")
+        fake_binary.touch()
+        monkeypatch.delenv("CHIMERAX_PATH", raising=False)
+        monkeypatch.setattr("chimerax_mcp.chimerax._installed_chimerax", None)
+
+        with patch(
+            "chimerax_mcp.chimerax._find_installed_chimerax",
+            return_value=ChimeraXInfo(path=fake_binary),
+        ) as find:
+            first = detect_chimerax()
+            second = detect_chimerax()
+
+        assert first is second
+        assert find.call_count == 1
+
+    def test_auto_detection_repeats_when_binary_removed(self, tmp_path, monkeypatch):
+        """A cached installation that disappeared triggers a fresh search."""
+        fake_binary = tmp_path.joinpath("ChimeraX")
+        monkeypatch.delenv("CHIMERAX_PATH", raising=False)
+        monkeypatch.setattr(
+            "chimerax_mcp.chimerax._installed_chimerax", ChimeraXInfo(path=fake_binary)
+        )
+
+        with patch("chimerax_mcp.chimerax._find_installed_chimerax", return_value=None) as find:
+            result = detect_chimerax()
+
+        assert result is None
+        assert find.call_count == 1
+
     def test_chimerax_path_env_nonexistent_falls_through(self):
         """CHIMERAX_PATH pointing to nonexistent path should fall through to auto-detection."""
         with patch.dict(os.environ, {"CHIMERAX_PATH": "/nonexistent/chimerax"}):
@@ -368,3 +628,22 @@ class TestVersionSortKey:
 
     def test_hyphenated_version(self):
         assert _version_sort_key("/Applications/ChimeraX-1.11.1.app") == (1, 11, 1)
+
+
+class TestNewestMatch:
+    def test_picks_highest_version_from_first_matching_pattern(self, tmp_path: Path):
+        for version in ("1.8", "1.10", "1.9"):
+            binary = tmp_path.joinpath(f"ChimeraX-{version}", "bin", "ChimeraX")
+            binary.parent.mkdir(parents=True)
+            binary.touch()
+        patterns = [
+            str(tmp_path.joinpath("Missing*", "bin", "ChimeraX")),
+            str(tmp_path.joinpath("ChimeraX-*", "bin", "ChimeraX")),
+        ]
+
+        newest = _newest_match(patterns)
+
+        assert newest == str(tmp_path.joinpath("ChimeraX-1.10", "bin", "ChimeraX"))
+
+    def test_no_matches_returns_none(self, tmp_path: Path):
+        assert _newest_match([str(tmp_path.joinpath("ChimeraX*"))]) is None
@@ -12,6 +12,7 @@ from chimerax_mcp.python_api import (
     build_python_dir_script,
     build_python_inspect_script,
     parse_introspection_result,
+    parse_marker_payload,
     run_python_api_script,
     validate_symbol,
 )
@@ -123,6 +124,15 @@ def test_parse_introspection_result_returns_error_when_payload_missing() -> None
     }
 
 
+def test_parse_marker_payload_uses_given_marker_and_label() -> None:
+    result = {"log_messages": {"info": [f'{MARKER}{{"status":"ok"}}', 'OTHER=["x"]']}}
+
+    assert parse_marker_payload(result, "OTHER=", "tool screenshot") == {
+        "status": "error",
+        "message": "Tool screenshot JSON payload was not an object",
+    }
+
+
 def test_run_python_api_script_runs_temp_file_and_returns_payload() -> None:
     payload = {"status": "ok", "value": 42}
 
@@ -10,6 +10,7 @@ import httpx
 from chimerax_mcp.chimerax import ChimeraXClient, detect_chimerax
 from chimerax_mcp.server import (
     _RESET_COMMANDS,
+    _TOOL_SCREENSHOT_MARKER,
     MAX_IMAGE_DIMENSION,
     MIN_IMAGE_DIMENSION,
     VALID_AXES,
@@ -32,6 +33,7 @@ from chimerax_mcp.server import (
     chimerax_session_save,
     chimerax_start,
     chimerax_status,
+    chimerax_stop,
     chimerax_structure_report,
     chimerax_tool_screenshot,
     chimerax_turn,
@@ -65,6 +67,52 @@ class TestGetClient:
         assert client1 is client2
 
 
+class TestCleanup:
+    def test_cleanup_closes_shared_client(self):
+        from chimerax_mcp.server import _cleanup
+
+        client = ChimeraXClient(port=59998)
+        with (
+            patch("chimerax_mcp.server._client", client),
+            patch("chimerax_mcp.server._process", None),
+            patch.object(client, "close") as mock_close,
+        ):
+            _cleanup()
+        mock_close.assert_called_once_with()
+
+    def test_sigterm_handler_cleans_up_and_exits(self):
+        from chimerax_mcp.server import _handle_sigterm
+
+        with (
+            patch("chimerax_mcp.server._cleanup") as mock_cleanup,
+            patch("chimerax_mcp.server.os._exit") as mock_exit,
+        ):
+            _handle_sigterm(15, None)
+
+        mock_cleanup.assert_called_once_with()
+        mock_exit.assert_called_once_with(143)
+
+
+class TestStopTool:
+    def test_stop_drops_shared_client(self):
+        class FakeProcess:
+            def terminate(self) -> None:
+                pass
+
+            def wait(self, timeout: float) -> int:
+                return 0
+
+        client = ChimeraXClient(port=59998)
+        with (
+            patch("chimerax_mcp.server._client", client),
+            patch("chimerax_mcp.server._process", FakeProcess()),
+        ):
+            result = chimerax_stop.fn()
+            assert get_client() is not client
+
+        assert result == {"status": "ok", "message": "ChimeraX stopped"}
+
+
 class TestScreenshotValidation:
     """Test screenshot input validation without needing ChimeraX."""
 
@@ -96,7 +144,7 @@ class TestScreenshotValidation:
     def test_screenshot_invalid_format(self):
         result = chimerax_screenshot.fn(width=1024, height=768, format="bmp")
         assert result["status"] == "error"
-        assert "format" in result["message"].lower()
+        assert result["message"] == "Format must be one of: jpeg, jpg, png"
 
     def test_screenshot_valid_formats(self):
         for fmt in VALID_IMAGE_FORMATS:
@@ -197,7 +245,7 @@ class TestStatusTool:
 
     def test_status_running_omits_version_by_default(self):
         mock_client = ChimeraXClient(port=59998)
-        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.is_running = lambda fresh=False: True  # type: ignore[assignment]
 
         def fail_get_version():
             raise AssertionError("status should not fetch version by default")
@@ -211,7 +259,7 @@ class TestStatusTool:
 
     def test_status_running_fetches_version_when_requested(self):
         mock_client = ChimeraXClient(port=59998)
-        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.is_running = lambda fresh=False: True  # type: ignore[assignment]
         mock_client.get_version = lambda: "UCSF ChimeraX version 1.11.1"  # type: ignore[assignment]
 
         with patch("chimerax_mcp.server.get_client", return_value=mock_client):
@@ -223,11 +271,27 @@ class TestStatusTool:
             "version": "UCSF ChimeraX version 1.11.1",
         }
 
+    def test_status_probes_without_cached_result(self):
+        mock_client = ChimeraXClient(port=59998)
+        checks: list[bool] = []
+
+        def fake_is_running(fresh: bool = False) -> bool:
+            checks.append(fresh)
+            return False
+
+        mock_client.is_running = fake_is_running  # type: ignore[assignment]
+
+        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
+            result = chimerax_status.fn()
+
+        assert result == {"status": "ok", "running": False}
+        assert checks == [True]
+
 
 class TestStartTool:
     def test_start_already_running_omits_version_by_default(self):
         mock_client = ChimeraXClient(port=59998)
-        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.is_running = lambda fresh=False: True  # type: ignore[assignment]
 
         def fail_get_version():
             raise AssertionError("start should not fetch version by default")
@@ -241,7 +305,7 @@ class TestStartTool:
 
     def test_start_already_running_fetches_version_when_requested(self):
         mock_client = ChimeraXClient(port=59998)
-        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.is_running = lambda fresh=False: True  # type: ignore[assignment]
         mock_client.get_version = lambda: "UCSF ChimeraX version 1.11.1"  # type: ignore[assignment]
 
         with patch("chimerax_mcp.server.get_client", return_value=mock_client):
@@ -263,7 +327,7 @@ class TestStartTool:
                 self.running_checks = 0
                 created_ports.append(port)
 
-            def is_running(self) -> bool:
+            def is_running(self, fresh: bool = False) -> bool:
                 self.running_checks += 1
                 return self.running_checks > 1
 
@@ -276,12 +340,93 @@ class TestStartTool:
             patch("chimerax_mcp.server._process", None),
             patch("chimerax_mcp.server.ChimeraXClient", FakeClient),
             patch("chimerax_mcp.server.start_chimerax", return_value=FakeProcess()),
-            patch("chimerax_mcp.server.time.sleep"),
+            patch("chimerax_mcp.server.time.sleep") as mock_sleep,
         ):
             result = chimerax_start.fn(port=65432, wait_seconds=3)
 
         assert created_ports == [65432]
         assert result == {"status": "started", "port": 65432}
+        mock_sleep.assert_called_once_with(0.01)
+
+    @staticmethod
+    def _start_against_fake_clock(
+        wait_seconds: int, probe_seconds: float
+    ) -> tuple[dict, list[float], list[bool], float]:
+        """Run chimerax_start with a clock that only sleeps and probes advance."""
+        mock_client = ChimeraXClient(port=59998)
+        clock = [0.0]
+        delays: list[float] = []
+        probes: list[bool] = []
+
+        def fake_sleep(seconds: float) -> None:
+            delays.append(seconds)
+            clock[0] += seconds
+
+        def fake_is_running(fresh: bool = False) -> bool:
+            probes.append(fresh)
+            clock[0] += probe_seconds
+            return False
+
+        mock_client.is_running = fake_is_running  # type: ignore[assignment]
+
+        class FakeProcess:
+            def poll(self) -> None:
+                return None
+
+        with (
+            patch("chimerax_mcp.server.get_client", return_value=mock_client),
+            patch("chimerax_mcp.server._process", None),
+            patch("chimerax_mcp.server.start_chimerax", return_value=FakeProcess()),
+            patch("chimerax_mcp.server.time.sleep", side_effect=fake_sleep),
+            patch("chimerax_mcp.server.time.monotonic", side_effect=lambda: clock[0]),
+        ):
+            result = chimerax_start.fn(wait_seconds=wait_seconds)
+        return result, delays, probes, clock[0]
+
+    def test_start_polls_with_backoff_until_timeout(self):
+        result, delays, probes, elapsed = self._start_against_fake_clock(5, probe_seconds=0.0)
+
+        assert result["status"] == "timeout"
+        assert delays[0] == 0.01
+        assert delays[:-1] == sorted(delays[:-1])
+        assert max(delays) == 0.2
+        assert abs(sum(delays) - 5) < 1e-9
+        assert abs(elapsed - 5) < 1e-9
+        # One fresh already-running check, then a REST probe after every sleep
+        assert probes == [True] + [False] * len(delays)
+
+    def test_start_timeout_counts_probe_time(self):
+        """Slow probes use up the wait instead of stretching it."""
+        result, delays, _probes, elapsed = self._start_against_fake_clock(3, probe_seconds=0.1)
+
+        assert result["status"] == "timeout"
+        # Already-running probe + 3 s wait + at most one probe past the deadline
+        assert elapsed <= 3.2 + 1e-9
+        assert sum(delays) < 3
+
+    def test_start_reports_process_exiting_during_startup(self):
+        mock_client = ChimeraXClient(port=59998)
+        mock_client.is_running = lambda fresh=False: False  # type: ignore[assignment]
+
+        class DeadProcess:
+            returncode = 1
+
+            def poll(self) -> int:
+                return self.returncode
+
+        with (
+            patch("chimerax_mcp.server.get_client", return_value=mock_client),
+            patch("chimerax_mcp.server._process", None),
+            patch("chimerax_mcp.server.start_chimerax", return_value=DeadProcess()),
+            patch("chimerax_mcp.server.time.sleep") as mock_sleep,
+        ):
+            result = chimerax_start.fn(wait_seconds=15)
+
+        assert result == {
+            "status": "error",
+            "message": "ChimeraX exited during startup (exit code 1)",
+        }
+        assert mock_sleep.call_count == 1
 
 
 class TestApiReferenceTools:
@@ -555,16 +700,16 @@ class TestResetTool:
             result = chimerax_reset.fn()
 
         assert result["status"] == "ok"
-        assert commands_run == _RESET_COMMANDS
+        assert commands_run == ["; ".join(_RESET_COMMANDS)]
 
     def test_reset_partial_failure(self):
+        """A failing batch falls back to per-command runs to report the failure."""
         mock_client = ChimeraXClient(port=59998)
-        call_count = 0
+        commands_run: list[str] = []
 
         def fake_run(cmd: str):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
+            commands_run.append(cmd)
+            if "hide atoms" in cmd:
                 return {
                     "python_values": [],
                     "json_values": [],
@@ -580,17 +725,15 @@ class TestResetTool:
             result = chimerax_reset.fn()
 
         assert result["status"] == "partial"
-        assert len(result["errors"]) == 1
+        assert result["errors"] == ["hide atoms: command failed"]
+        assert commands_run == ["; ".join(_RESET_COMMANDS), *_RESET_COMMANDS]
 
     def test_reset_http_error(self):
         """HTTPError during reset is captured and execution continues."""
         mock_client = ChimeraXClient(port=59998)
-        call_count = 0
 
         def fake_run(cmd: str):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 3:
+            if "hide surface" in cmd:
                 raise httpx.HTTPError("connection reset")
             return {"status": "ok"}
 
@@ -611,7 +754,7 @@ class TestResetTool:
 
         def fake_run(cmd: str):
             commands_run.append(cmd)
-            if len(commands_run) == 2:
+            if "hide atoms" in cmd:
                 raise httpx.ConnectError("connection refused")
             return {"status": "ok"}
 
@@ -623,8 +766,50 @@ class TestResetTool:
 
         assert result["status"] == "error"
         assert "lost connection" in result["message"].lower()
-        # Should have stopped after 2 commands (not all 7)
-        assert len(commands_run) == 2
+        # Should have stopped after the batched request (no per-command retry)
+        assert len(commands_run) == 1
+
+    def test_reset_timeout_is_not_retried_per_command(self):
+        """A timed-out batched reset is reported instead of re-running each command."""
+        mock_client = ChimeraXClient(port=59998)
+        commands_run: list[str] = []
+
+        def fake_run(cmd: str):
+            commands_run.append(cmd)
+            raise httpx.ReadTimeout("timed out")
+
+        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.run_command = fake_run  # type: ignore[assignment]
+
+        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
+            result = chimerax_reset.fn()
+
+        assert result["status"] == "error"
+        assert "timed out" in result["message"].lower()
+        assert len(commands_run) == 1
+
+    def test_reset_connect_error_during_fallback_aborts(self):
+        """ConnectError while re-running commands one by one stops the fallback."""
+        mock_client = ChimeraXClient(port=59998)
+        commands_run: list[str] = []
+
+        def fake_run(cmd: str):
+            commands_run.append(cmd)
+            if ";" in cmd:
+                return {"error": {"type": "UserError", "message": "chain failed"}}
+            if cmd == "hide atoms":
+                raise httpx.ConnectError("connection refused")
+            return {"error": None}
+
+        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        mock_client.run_command = fake_run  # type: ignore[assignment]
+
+        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
+            result = chimerax_reset.fn()
+
+        assert result["status"] == "error"
+        assert "lost connection" in result["message"].lower()
+        assert commands_run == ["; ".join(_RESET_COMMANDS), "hide pseudobonds", "hide atoms"]
 
     def test_reset_all_commands_fail(self):
         """When every command fails, status is 'error'."""
@@ -650,75 +835,69 @@ class TestResetTool:
 
 
 class TestScreenshotAutoFit:
-    def test_auto_fit_true_runs_view(self, tmp_path: Path):
+    @staticmethod
+    def _capture_kwargs(tmp_path: Path, auto_fit: bool) -> tuple[dict, dict]:
         mock_client = ChimeraXClient(port=59998)
-        commands_run: list[str] = []
         fake_file = tmp_path.joinpath("shot.png")
+        screenshot_kwargs: dict = {}
 
-        def fake_run(cmd: str):
-            commands_run.append(cmd)
-            return {"status": "ok"}
-
-        def fake_screenshot(**kwargs):  # noqa: ARG001
+        def fake_screenshot(**kwargs):
+            screenshot_kwargs.update(kwargs)
             fake_file.write_bytes(b"PNG_DATA")
             return fake_file
 
         mock_client.is_running = lambda: True  # type: ignore[assignment]
-        mock_client.run_command = fake_run  # type: ignore[assignment]
         mock_client.screenshot = fake_screenshot  # type: ignore[assignment]
 
         with patch("chimerax_mcp.server.get_client", return_value=mock_client):
-            result = chimerax_screenshot.fn(width=100, height=100, format="png", auto_fit=True)
+            result = chimerax_screenshot.fn(width=100, height=100, format="png", auto_fit=auto_fit)
+        return result, screenshot_kwargs
+
+    def test_auto_fit_true_runs_view(self, tmp_path: Path):
+        result, kwargs = self._capture_kwargs(tmp_path, auto_fit=True)
 
         assert result["status"] == "ok"
-        assert "view" in commands_run
+        assert kwargs["pre_commands"] == ["view"]
 
     def test_auto_fit_false_skips_view(self, tmp_path: Path):
-        mock_client = ChimeraXClient(port=59998)
-        commands_run: list[str] = []
-        fake_file = tmp_path.joinpath("shot.png")
-
-        def fake_run(cmd: str):
-            commands_run.append(cmd)
-            return {"status": "ok"}
-
-        def fake_screenshot(**kwargs):  # noqa: ARG001
-            fake_file.write_bytes(b"PNG_DATA")
-            return fake_file
-
-        mock_client.is_running = lambda: True  # type: ignore[assignment]
-        mock_client.run_command = fake_run  # type: ignore[assignment]
-        mock_client.screenshot = fake_screenshot  # type: ignore[assignment]
-
-        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
-            result = chimerax_screenshot.fn(width=100, height=100, format="png", auto_fit=False)
+        result, kwargs = self._capture_kwargs(tmp_path, auto_fit=False)
 
         assert result["status"] == "ok"
-        assert "view" not in commands_run
+        assert kwargs["pre_commands"] is None
 
     def test_auto_fit_view_failure_still_captures(self, tmp_path: Path):
-        """When auto_fit view command raises HTTPError, screenshot still proceeds."""
+        """A failed view in plain-text mode (no error reported) still saves the image."""
         mock_client = ChimeraXClient(port=59998)
-        fake_file = tmp_path.joinpath("shot.png")
+        shot = tmp_path.joinpath("shot.png")
+        commands_run: list[str] = []
 
         def fake_run(cmd: str):
-            if cmd == "view":
-                raise httpx.HTTPError("view failed")
-            return {"status": "ok"}
-
-        def fake_screenshot(**kwargs):  # noqa: ARG001
-            fake_file.write_bytes(b"PNG_DATA")
-            return fake_file
+            commands_run.append(cmd)
+            if cmd.startswith("save"):
+                shot.write_bytes(b"PNG_DATA")
+            return {
+                "python_values": [],
+                "json_values": [],
+                "log_messages": {"info": []},
+                "error": None,
+            }
 
         mock_client.is_running = lambda: True  # type: ignore[assignment]
         mock_client.run_command = fake_run  # type: ignore[assignment]
-        mock_client.screenshot = fake_screenshot  # type: ignore[assignment]
 
         with patch("chimerax_mcp.server.get_client", return_value=mock_client):
-            result = chimerax_screenshot.fn(width=100, height=100, format="png", auto_fit=True)
+            result = chimerax_screenshot.fn(
+                width=100, height=100, format="png", output_path=str(shot), auto_fit=True
+            )
 
         assert result["status"] == "ok"
-        assert result["file_path"] == str(fake_file)
+        assert result["file_path"] == str(shot)
+        assert commands_run[-1] == f"save {shot} width 100 height 100"
+        assert len(commands_run) == 2
+
+
+def _tool_marker(payload: dict) -> str:
+    return _TOOL_SCREENSHOT_MARKER + json.dumps(payload)
 
 
 class TestToolScreenshot:
@@ -745,7 +924,11 @@ class TestToolScreenshot:
             return {
                 "python_values": [],
                 "json_values": [None],
-                "log_messages": {"info": ["ERROR: Tool 'Nonexistent' not found"]},
+                "log_messages": {
+                    "info": [
+                        _tool_marker({"status": "error", "message": "Tool 'Nonexistent' not found"})
+                    ]
+                },
                 "error": None,
             }
 
@@ -770,7 +953,9 @@ class TestToolScreenshot:
                 return {
                     "python_values": [],
                     "json_values": [None],
-                    "log_messages": {"info": [f"OK: {output_file}"]},
+                    "log_messages": {
+                        "info": [_tool_marker({"status": "ok", "file_path": str(output_file)})]
+                    },
                     "error": None,
                 }
             return {"python_values": [], "json_values": [], "log_messages": {}, "error": None}
@@ -785,6 +970,29 @@ class TestToolScreenshot:
         assert result["status"] == "ok"
         assert result["file_path"] == str(output_file)
 
+    def test_path_containing_error_text_is_ok(self, tmp_path: Path):
+        """Only the marker payload decides success, not text in the output path."""
+        mock_client = ChimeraXClient(port=59998)
+        mock_client.is_running = lambda: True  # type: ignore[assignment]
+        output_file = tmp_path.joinpath("ERROR: shot.png")
+
+        def fake_run(cmd: str):  # noqa: ARG001
+            return {
+                "python_values": [],
+                "json_values": [None],
+                "log_messages": {
+                    "info": [_tool_marker({"status": "ok", "file_path": str(output_file)})]
+                },
+                "error": None,
+            }
+
+        mock_client.run_command = fake_run  # type: ignore[assignment]
+
+        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
+            result = chimerax_tool_screenshot.fn(tool_name="Log", output_path=str(output_file))
+
+        assert result == {"status": "ok", "tool_name": "Log", "file_path": str(output_file)}
+
     def test_default_output_path(self):
         """When no output_path given, a default path under screenshots dir is generated."""
         mock_client = ChimeraXClient(port=59998)
@@ -796,7 +1004,9 @@ class TestToolScreenshot:
                 return {
                     "python_values": [],
                     "json_values": [None],
-                    "log_messages": {"info": ["OK: /some/path.png"]},
+                    "log_messages": {
+                        "info": [_tool_marker({"status": "ok", "file_path": "/some/path.png"})]
+                    },
                     "error": None,
                 }
             return {"python_values": [], "json_values": [], "log_messages": {}, "error": None}
@@ -838,7 +1048,9 @@ class TestToolScreenshot:
                 return {
                     "python_values": [],
                     "json_values": [None],
-                    "log_messages": {"info": [f"OK: {output_file}"]},
+                    "log_messages": {
+                        "info": [_tool_marker({"status": "ok", "file_path": str(output_file)})]
+                    },
                     "error": None,
                 }
             return {"python_values": [], "json_values": [], "log_messages": {}, "error": None}
@@ -880,7 +1092,9 @@ class TestToolScreenshot:
                 return {
                     "python_values": [],
                     "json_values": [None],
-                    "log_messages": {"info": [f"OK: {output_file}"]},
+                    "log_messages": {
+                        "info": [_tool_marker({"status": "ok", "file_path": str(output_file)})]
+                    },
                     "error": None,
                 }
             return {"python_values": [], "json_values": [], "log_messages": {}, "error": None}
@@ -938,7 +1152,7 @@ class TestToolScreenshot:
         assert "http error" in result["message"].lower()
 
     def test_unexpected_output(self):
-        """Unexpected output (no OK: or ERROR: marker) returns error."""
+        """Unexpected output (no result marker line) returns error."""
         mock_client = ChimeraXClient(port=59998)
         mock_client.is_running = lambda: True  # type: ignore[assignment]
 
@@ -956,7 +1170,29 @@ class TestToolScreenshot:
             result = chimerax_tool_screenshot.fn(tool_name="Chain Contacts")
 
         assert result["status"] == "error"
-        assert "unexpected" in result["message"].lower()
+        assert "no tool screenshot json payload" in result["message"].lower()
+        assert "some random output" in result["message"]
+
+    def test_script_traceback_is_reported(self):
+        """A runscript failure without a marker line surfaces ChimeraX's error."""
+        mock_client = ChimeraXClient(port=59998)
+        mock_client.is_running = lambda: True  # type: ignore[assignment]
+
+        def fake_run(cmd: str):
+            return {
+                "python_values": [],
+                "json_values": [None],
+                "log_messages": {"error": ["Traceback ..."]},
+                "error": {"type": "NameError", "message": "name 'qt' is not defined"},
+            }
+
+        mock_client.run_command = fake_run  # type: ignore[assignment]
+
+        with patch("chimerax_mcp.server.get_client", return_value=mock_client):
+            result = chimerax_tool_screenshot.fn(tool_name="Chain Contacts")
+
+        assert result["status"] == "error"
+        assert "name 'qt' is not defined" in result["message"]
 
     def test_whitespace_output_path_rejected(self):
         """Whitespace-only output_path is rejected."""
@@ -1030,7 +1266,7 @@ class TestBuildToolScreenshotScript:
         """Generated script includes try/except for Qt errors."""
         script = _build_tool_screenshot_script(tool_name="Log", output_path="/tmp/out.png")
         assert "except Exception as exc:" in script
-        assert "session.logger.info('ERROR: ' + str(exc))" in script
+        assert "emit({'status': 'error', 'message': str(exc)})" in script
 
     def test_no_sys_exit(self):
         """Generated script does not call sys.exit."""
@@ -1043,14 +1279,16 @@ class TestBuildToolScreenshotScript:
         assert "if not pixmap.save(output_path):" in script
 
     def test_tool_not_found_marker(self):
-        """Generated script logs ERROR marker when tool not found."""
+        """Generated script emits an error payload when tool not found."""
         script = _build_tool_screenshot_script(tool_name="Missing", output_path="/tmp/out.png")
-        assert "session.logger.info('ERROR: Tool '" in script
+        assert f"marker = {_TOOL_SCREENSHOT_MARKER!r}" in script
+        assert "emit({'status': 'error', 'message': 'Tool '" in script
 
     def test_success_marker(self):
-        """Generated script logs OK marker on success."""
+        """Generated script emits an ok payload on success."""
         script = _build_tool_screenshot_script(tool_name="Log", output_path="/tmp/out.png")
-        assert "session.logger.info(f'OK: {output_path}')" in script
+        assert "emit({'status': 'ok', 'file_path': output_path})" in script
+        assert "session.logger.info(marker + json.dumps(payload))" in script
 
 
 class TestConstants: